@@ -7,7 +7,7 @@ import os
 import sys
 from typing import ClassVar, Optional, Sequence, Tuple
 
-from ._common import normalize_platform, unprintable_ascii_chars
+from ._common import is_ascii_compatible_encoding, normalize_platform, unprintable_ascii_chars
 from ._const import DEFAULT_MIN_LEN, Platform
 from ._types import PathType, PlatformType
 from .error import ReservedNameError, ValidationError
@@ -62,6 +62,14 @@ class BaseFile:
             self._fs_encoding = fs_encoding
         else:
             self._fs_encoding = sys.getfilesystemencoding()
+        self._is_ascii_compatible_fs_encoding = is_ascii_compatible_encoding(self._fs_encoding)
+
+    def _get_byte_count(self, value: str) -> int:
+        # ASCII strings have one byte per character with ASCII compatible encodings
+        if self._is_ascii_compatible_fs_encoding and value.isascii():
+            return len(value)
+
+        return len(value.encode(self._fs_encoding))
 
     def _is_posix(self) -> bool:
         return self.platform == Platform.POSIX
@@ -216,9 +224,7 @@ class BaseValidator(AbstractValidator):
         root_name = self.__extract_root_name(name)
         base_name = os.path.basename(name).upper()
 
-        if self._is_reserved_keyword(root_name.upper()) or self._is_reserved_keyword(
-            base_name.upper()
-        ):
+        if self._is_reserved_keyword(root_name.upper()) or self._is_reserved_keyword(base_name):
             raise ReservedNameError(
                 f"'{root_name}' is a reserved name",
                 reusable_name=False,
@@ -2,11 +2,13 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import codecs
 import platform
 import re
 import string
+from functools import lru_cache
 from pathlib import PurePath
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from ._const import Platform
 from ._types import PathType, PlatformType
@@ -90,8 +92,10 @@ __RE_ANSI_ESCAPE = re.compile(
 def validate_unprintable_char(text: str) -> None:
     from .error import InvalidCharError
 
-    match_list = __RE_UNPRINTABLE_CHARS.findall(to_str(text))
-    if match_list:
+    unicode_text = to_str(text)
+    match = __RE_UNPRINTABLE_CHARS.search(unicode_text)
+    if match:
+        match_list = __RE_UNPRINTABLE_CHARS.findall(unicode_text, match.start())
         raise InvalidCharError(f"unprintable character found: {match_list}")
 
 
@@ -102,6 +106,15 @@ def replace_unprintable_char(text: str, replacement_text: str = "") -> str:
         raise TypeError("text must be a string")
 
 
+@lru_cache(maxsize=32)
+def make_replace_table(invalid_chars: str, replacement_text: str) -> Dict[int, Optional[str]]:
+    """Build a :py:meth:`str.translate` table that replaces ``invalid_chars``
+    with ``replacement_text`` (or removes them if ``replacement_text`` is empty).
+    """
+
+    return {ord(c): replacement_text or None for c in invalid_chars}
+
+
 def replace_ansi_escape(text: str, replacement_text: str = "") -> str:
     try:
         return __RE_ANSI_ESCAPE.sub(replacement_text, text)
@@ -109,7 +122,35 @@ def replace_ansi_escape(text: str, replacement_text: str = "") -> str:
         raise TypeError("text must be a string")
 
 
+_PLATFORM_NAME_MAP = {
+    "posix": Platform.POSIX,
+    "linux": Platform.LINUX,
+    "mac": Platform.MACOS,
+    "macos": Platform.MACOS,
+    "darwin": Platform.MACOS,
+}
+
+
+def _to_platform(platform_str: str) -> Platform:
+    if platform_str.startswith("win"):
+        return Platform.WINDOWS
+
+    return _PLATFORM_NAME_MAP.get(platform_str, Platform.UNIVERSAL)
+
+
+@lru_cache(maxsize=1)
+def _detect_platform() -> Platform:
+    return _to_platform(platform.system().casefold())
+
+
 def normalize_platform(name: Optional[PlatformType]) -> Platform:
+    """Convert ``name`` to a :py:class:`~pathvalidate.Platform`.
+
+    The platform detected for ``"auto"`` is cached for the lifetime of the process:
+    changes to :py:func:`platform.system` afterwards (e.g. by monkeypatching) are not
+    reflected until ``_detect_platform.cache_clear()`` is called.
+    """
+
     if isinstance(name, Platform):
         return name
 
@@ -118,26 +159,24 @@ def normalize_platform(name: Optional[PlatformType]) -> Platform:
 
     platform_str = name.strip().casefold()
 
-    if platform_str == "posix":
-        return Platform.POSIX
-
     if platform_str == "auto":
-        platform_str = platform.system().casefold()
+        return _detect_platform()
 
-    if platform_str in ["linux"]:
-        return Platform.LINUX
+    return _to_platform(platform_str)
 
-    if platform_str and platform_str.startswith("win"):
-        return Platform.WINDOWS
 
-    if platform_str in ["mac", "macos", "darwin"]:
-        return Platform.MACOS
+def findall_to_str(match: List[Any]) -> str:
+    return ", ".join([repr(text) for text in match])
 
-    return Platform.UNIVERSAL
 
+_ASCII_COMPATIBLE_ENCODINGS = frozenset(("ascii", "utf-8", "iso8859-1", "cp1252"))
 
-def findall_to_str(match: List[Any]) -> str:
-    return ", ".join([repr(text) for text in match])
+
+def is_ascii_compatible_encoding(encoding: str) -> bool:
+    try:
+        return codecs.lookup(encoding).name in _ASCII_COMPATIBLE_ENCODINGS
+    except LookupError:
+        return False
 
 
 def truncate_str(text: str, encoding: str, max_bytes: int) -> str:
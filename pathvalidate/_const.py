@@ -1,4 +1,6 @@
 import enum
+import itertools
+import re
 
 
 DEFAULT_MIN_LEN = 1
@@ -21,6 +23,36 @@ _NTFS_RESERVED_FILE_NAMES = (
     "$ObjId",
     "$Reparse",
 )  # Only in root directory
+_NTFS_RESERVED_FILE_NAMES_SET = frozenset(_NTFS_RESERVED_FILE_NAMES)
+_RE_NTFS_RESERVED = re.compile(
+    "|".join(f"^/{re.escape(pattern)}$" for pattern in _NTFS_RESERVED_FILE_NAMES),
+    re.IGNORECASE,
+)
+
+_WIN_RESERVED_FILE_NAMES = ("CON", "PRN", "AUX", "CLOCK$", "NUL") + tuple(
+    f"{name:s}{num:d}" for name, num in itertools.product(("COM", "LPT"), range(1, 10))
+)
+
+
+def is_win_device_name(name: str) -> bool:
+    """Check whether the ``name`` is one of the Windows device names
+    (``_WIN_RESERVED_FILE_NAMES``).
+
+    The ``name`` is expected to be upper-cased by the caller.
+    """
+
+    # specialized for the fixed layout of the Windows device names:
+    # CON/PRN/AUX/NUL, COM[1-9]/LPT[1-9] and CLOCK$
+    name_len = len(name)
+
+    if name_len == 3:
+        return name in ("CON", "PRN", "AUX", "NUL")
+    if name_len == 4:
+        return name[:3] in ("COM", "LPT") and "1" <= name[3] <= "9"
+    if name_len == 6:
+        return name == "CLOCK$"
+
+    return False
 
 
 @enum.unique
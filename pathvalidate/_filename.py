@@ -2,17 +2,22 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
-import itertools
 import ntpath
 import posixpath
 import re
 import warnings
 from pathlib import Path, PurePath
-from typing import Optional, Pattern, Sequence, Tuple
+from typing import Any, Dict, Optional, Pattern, Sequence, Tuple
 
 from ._base import AbstractSanitizer, AbstractValidator, BaseFile, BaseValidator
-from ._common import findall_to_str, to_str, truncate_str, validate_pathtype
-from ._const import DEFAULT_MIN_LEN, INVALID_CHAR_ERR_MSG_TMPL, Platform
+from ._common import findall_to_str, make_replace_table, to_str, truncate_str, validate_pathtype
+from ._const import (
+    _WIN_RESERVED_FILE_NAMES,
+    DEFAULT_MIN_LEN,
+    INVALID_CHAR_ERR_MSG_TMPL,
+    Platform,
+    is_win_device_name,
+)
 from ._types import PathType, PlatformType
 from .error import ErrorAttrKey, ErrorReason, InvalidCharError, ValidationError
 from .handler import ReservedNameHandler, ValidationErrorHandler
@@ -62,6 +67,7 @@ class FileNameSanitizer(AbstractSanitizer):
         )
 
         self._sanitize_regexp = self._get_sanitize_regexp()
+        self._sanitize_chars = self._get_sanitize_chars()
 
     def sanitize(self, value: PathType, replacement_text: str = "") -> PathType:
         try:
@@ -74,7 +80,11 @@ class FileNameSanitizer(AbstractSanitizer):
                 return self._null_value_handler(e)  # type: ignore
             raise
 
-        sanitized_filename = self._sanitize_regexp.sub(replacement_text, str(value))
+        sanitized_filename = str(value)
+        if self._sanitize_regexp.search(sanitized_filename):
+            sanitized_filename = sanitized_filename.translate(
+                make_replace_table(self._sanitize_chars, replacement_text)
+            )
         sanitized_filename = truncate_str(sanitized_filename, self._fs_encoding, self.max_len)
 
         try:
@@ -120,11 +130,15 @@ class FileNameSanitizer(AbstractSanitizer):
 
         return _RE_INVALID_FILENAME
 
+    def _get_sanitize_chars(self) -> str:
+        if self._is_windows(include_universal=True):
+            return self._INVALID_WIN_FILENAME_CHARS
+
+        return self._INVALID_FILENAME_CHARS
+
 
 class FileNameValidator(BaseValidator):
-    _WINDOWS_RESERVED_FILE_NAMES = ("CON", "PRN", "AUX", "CLOCK$", "NUL") + tuple(
-        f"{name:s}{num:d}" for name, num in itertools.product(("COM", "LPT"), range(1, 10))
-    )
+    _WINDOWS_RESERVED_FILE_NAMES = _WIN_RESERVED_FILE_NAMES
     _MACOS_RESERVED_FILE_NAMES = (":",)
 
     @property
@@ -165,15 +179,24 @@ class FileNameValidator(BaseValidator):
             platform=platform,
         )
 
+        # derived from reserved_keywords: when every Windows device name is reserved,
+        # those are checked by is_win_device_name() and the rest by the set
+        reserved_keywords = frozenset(self.reserved_keywords)
+        win_reserved_keywords = frozenset(_WIN_RESERVED_FILE_NAMES)
+        self.__check_win_reserved = win_reserved_keywords <= reserved_keywords
+        if self.__check_win_reserved:
+            reserved_keywords -= win_reserved_keywords
+        self.__reserved_keywords = reserved_keywords
+
     def validate(self, value: PathType) -> None:
         validate_pathtype(value, allow_whitespaces=not self._is_windows(include_universal=True))
 
         unicode_filename = to_str(value)
-        byte_ct = len(unicode_filename.encode(self._fs_encoding))
+        byte_ct = self._get_byte_count(unicode_filename)
 
         self.validate_abspath(unicode_filename)
 
-        err_kwargs = {
+        err_kwargs: Dict[str, Any] = {
             ErrorAttrKey.REASON: ErrorReason.INVALID_LENGTH,
             ErrorAttrKey.PLATFORM: self.platform,
             ErrorAttrKey.FS_ENCODING: self._fs_encoding,
@@ -181,16 +204,12 @@ class FileNameValidator(BaseValidator):
         }
         if byte_ct > self.max_len:
             raise ValidationError(
-                [
-                    f"filename is too long: expected<={self.max_len:d} bytes, actual={byte_ct:d} bytes"
-                ],
+                f"filename is too long: expected<={self.max_len:d} bytes, actual={byte_ct:d} bytes",
                 **err_kwargs,
             )
         if byte_ct < self.min_len:
             raise ValidationError(
-                [
-                    f"filename is too short: expected>={self.min_len:d} bytes, actual={byte_ct:d} bytes"
-                ],
+                f"filename is too short: expected>={self.min_len:d} bytes, actual={byte_ct:d} bytes",
                 **err_kwargs,
             )
 
@@ -200,6 +219,13 @@ class FileNameValidator(BaseValidator):
         if self._is_windows(include_universal=True):
             self.__validate_win_filename(unicode_filename)
 
+    def _is_reserved_keyword(self, value: str) -> bool:
+        # value is upper-cased by _validate_reserved_keywords()
+        if self.__check_win_reserved and is_win_device_name(value):
+            return True
+
+        return value in self.__reserved_keywords
+
     def validate_abspath(self, value: str) -> None:
         err = ValidationError(
             description=f"found an absolute path ({value}), expected a filename",
@@ -215,21 +241,27 @@ class FileNameValidator(BaseValidator):
             raise err
 
     def __validate_universal_filename(self, unicode_filename: str) -> None:
-        match = _RE_INVALID_FILENAME.findall(unicode_filename)
+        match = _RE_INVALID_FILENAME.search(unicode_filename)
         if match:
             raise InvalidCharError(
                 INVALID_CHAR_ERR_MSG_TMPL.format(
-                    invalid=findall_to_str(match), value=repr(unicode_filename)
+                    invalid=findall_to_str(
+                        _RE_INVALID_FILENAME.findall(unicode_filename, match.start())
+                    ),
+                    value=repr(unicode_filename),
                 ),
                 platform=Platform.UNIVERSAL,
             )
 
     def __validate_win_filename(self, unicode_filename: str) -> None:
-        match = _RE_INVALID_WIN_FILENAME.findall(unicode_filename)
+        match = _RE_INVALID_WIN_FILENAME.search(unicode_filename)
         if match:
             raise InvalidCharError(
                 INVALID_CHAR_ERR_MSG_TMPL.format(
-                    invalid=findall_to_str(match), value=repr(unicode_filename)
+                    invalid=findall_to_str(
+                        _RE_INVALID_WIN_FILENAME.findall(unicode_filename, match.start())
+                    ),
+                    value=repr(unicode_filename),
                 ),
                 platform=Platform.WINDOWS,
             )
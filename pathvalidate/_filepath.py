@@ -8,11 +8,17 @@ import posixpath
 import re
 import warnings
 from pathlib import Path, PurePath
-from typing import List, Optional, Pattern, Sequence, Tuple
+from typing import Any, Dict, List, Optional, Pattern, Sequence, Tuple
 
 from ._base import AbstractSanitizer, AbstractValidator, BaseFile, BaseValidator
-from ._common import findall_to_str, to_str, validate_pathtype
-from ._const import _NTFS_RESERVED_FILE_NAMES, DEFAULT_MIN_LEN, INVALID_CHAR_ERR_MSG_TMPL, Platform
+from ._common import findall_to_str, make_replace_table, to_str, validate_pathtype
+from ._const import (
+    _NTFS_RESERVED_FILE_NAMES_SET,
+    _RE_NTFS_RESERVED,
+    DEFAULT_MIN_LEN,
+    INVALID_CHAR_ERR_MSG_TMPL,
+    Platform,
+)
 from ._filename import FileNameSanitizer, FileNameValidator
 from ._types import PathType, PlatformType
 from .error import ErrorAttrKey, ErrorReason, InvalidCharError, ReservedNameError, ValidationError
@@ -59,6 +65,7 @@ class FilePathSanitizer(AbstractSanitizer):
         )
 
         self._sanitize_regexp = self._get_sanitize_regexp()
+        self._sanitize_chars = self._get_sanitize_chars()
         self.__fname_sanitizer = FileNameSanitizer(
             max_len=self.max_len,
             fs_encoding=fs_encoding,
@@ -88,7 +95,10 @@ class FilePathSanitizer(AbstractSanitizer):
 
         unicode_filepath = to_str(value)
         drive, unicode_filepath = self.__split_drive(unicode_filepath)
-        unicode_filepath = self._sanitize_regexp.sub(replacement_text, unicode_filepath)
+        if self._sanitize_regexp.search(unicode_filepath):
+            unicode_filepath = unicode_filepath.translate(
+                make_replace_table(self._sanitize_chars, replacement_text)
+            )
         if self.__normalize and unicode_filepath:
             unicode_filepath = os.path.normpath(unicode_filepath)
         sanitized_path = unicode_filepath
@@ -97,7 +107,7 @@ class FilePathSanitizer(AbstractSanitizer):
         if drive:
             sanitized_entries.append(drive)
         for entry in sanitized_path.replace("\\", "/").split("/"):
-            if entry in _NTFS_RESERVED_FILE_NAMES:
+            if entry[:1] == "$" and entry in _NTFS_RESERVED_FILE_NAMES_SET:
                 sanitized_entries.append(f"{entry}_")
                 continue
 
@@ -132,6 +142,12 @@ class FilePathSanitizer(AbstractSanitizer):
 
         return _RE_INVALID_PATH
 
+    def _get_sanitize_chars(self) -> str:
+        if self._is_windows(include_universal=True):
+            return self._INVALID_WIN_PATH_CHARS
+
+        return self._INVALID_PATH_CHARS
+
     def __get_path_separator(self) -> str:
         if self._is_windows():
             return "\\"
@@ -140,10 +156,7 @@ class FilePathSanitizer(AbstractSanitizer):
 
 
 class FilePathValidator(BaseValidator):
-    _RE_NTFS_RESERVED = re.compile(
-        "|".join(f"^/{re.escape(pattern)}$" for pattern in _NTFS_RESERVED_FILE_NAMES),
-        re.IGNORECASE,
-    )
+    _RE_NTFS_RESERVED = _RE_NTFS_RESERVED
     _MACOS_RESERVED_FILE_PATHS = ("/", ":")
 
     @property
@@ -198,8 +211,8 @@ class FilePathValidator(BaseValidator):
             return
 
         unicode_filepath = to_str(tail)
-        byte_ct = len(unicode_filepath.encode(self._fs_encoding))
-        err_kwargs = {
+        byte_ct = self._get_byte_count(unicode_filepath)
+        err_kwargs: Dict[str, Any] = {
             ErrorAttrKey.REASON: ErrorReason.INVALID_LENGTH,
             ErrorAttrKey.PLATFORM: self.platform,
             ErrorAttrKey.FS_ENCODING: self._fs_encoding,
@@ -208,18 +221,14 @@ class FilePathValidator(BaseValidator):
 
         if byte_ct > self.max_len:
             raise ValidationError(
-                [
-                    f"file path is too long: expected<={self.max_len:d} bytes, actual={byte_ct:d} bytes"
-                ],
+                f"file path is too long: expected<={self.max_len:d} bytes, actual={byte_ct:d} bytes",
                 **err_kwargs,
             )
         if byte_ct < self.min_len:
             raise ValidationError(
-                [
-                    "file path is too short: expected>={:d} bytes, actual={:d} bytes".format(
-                        self.min_len, byte_ct
-                    )
-                ],
+                "file path is too short: expected>={:d} bytes, actual={:d} bytes".format(
+                    self.min_len, byte_ct
+                ),
                 **err_kwargs,
             )
 
@@ -272,20 +281,26 @@ class FilePathValidator(BaseValidator):
             raise err_object
 
     def __validate_unix_filepath(self, unicode_filepath: str) -> None:
-        match = _RE_INVALID_PATH.findall(unicode_filepath)
+        match = _RE_INVALID_PATH.search(unicode_filepath)
         if match:
             raise InvalidCharError(
                 INVALID_CHAR_ERR_MSG_TMPL.format(
-                    invalid=findall_to_str(match), value=repr(unicode_filepath)
+                    invalid=findall_to_str(
+                        _RE_INVALID_PATH.findall(unicode_filepath, match.start())
+                    ),
+                    value=repr(unicode_filepath),
                 )
             )
 
     def __validate_win_filepath(self, unicode_filepath: str) -> None:
-        match = _RE_INVALID_WIN_PATH.findall(unicode_filepath)
+        match = _RE_INVALID_WIN_PATH.search(unicode_filepath)
         if match:
             raise InvalidCharError(
                 INVALID_CHAR_ERR_MSG_TMPL.format(
-                    invalid=findall_to_str(match), value=repr(unicode_filepath)
+                    invalid=findall_to_str(
+                        _RE_INVALID_WIN_PATH.findall(unicode_filepath, match.start())
+                    ),
+                    value=repr(unicode_filepath),
                 ),
                 platform=Platform.WINDOWS,
             )
@@ -23,8 +23,10 @@ def validate_ltsv_label(label: str) -> None:
 
     validate_pathtype(label, allow_whitespaces=False)
 
-    match_list = __RE_INVALID_LTSV_LABEL.findall(to_str(label))
-    if match_list:
+    unicode_label = to_str(label)
+    match = __RE_INVALID_LTSV_LABEL.search(unicode_label)
+    if match:
+        match_list = __RE_INVALID_LTSV_LABEL.findall(unicode_label, match.start())
         raise InvalidCharError(f"invalid character found for a LTSV format label: {match_list}")
 
 
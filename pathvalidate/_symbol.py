@@ -27,8 +27,10 @@ def validate_symbol(text: str) -> None:
             If symbol(s) included in the ``text``.
     """
 
-    match_list = __RE_SYMBOL.findall(to_str(text))
-    if match_list:
+    unicode_text = to_str(text)
+    match = __RE_SYMBOL.search(unicode_text)
+    if match:
+        match_list = __RE_SYMBOL.findall(unicode_text, match.start())
         raise InvalidCharError(f"invalid symbols found: {match_list}")
 
 
@@ -3,15 +3,12 @@
 """
 
 import enum
-from typing import Dict, Optional
+import sys
+from typing import Dict, Optional, Tuple
 
 from ._const import Platform
 
 
-def _to_error_code(code: int) -> str:
-    return f"PV{code:04d}"
-
-
 class ErrorAttrKey:
     BYTE_COUNT = "byte_count"
     DESCRIPTION = "description"
@@ -22,66 +19,45 @@ class ErrorAttrKey:
     REUSABLE_NAME = "reusable_name"
 
 
+# error code number -> (code, description)
+_ERROR_META: Dict[int, Tuple[str, str]] = {
+    1001: ("PV1001", "the value must not be an empty string"),
+    1002: ("PV1002", "found a reserved name by a platform"),
+    1100: ("PV1100", "invalid characters found"),
+    1101: ("PV1101", "found an invalid string length"),
+    1200: ("PV1200", "found an absolute path where must be a relative path"),
+    1201: ("PV1201", "found a malformed absolute path"),
+    2000: ("PV2000", "found invalid value after sanitizing"),
+}
+
+
 @enum.unique
-class ErrorReason(enum.Enum):
+class ErrorReason(enum.IntEnum):
     """
     Validation error reasons.
     """
 
-    NULL_NAME = (_to_error_code(1001), "NULL_NAME", "the value must not be an empty string")
-    RESERVED_NAME = (
-        _to_error_code(1002),
-        "RESERVED_NAME",
-        "found a reserved name by a platform",
-    )
-    INVALID_CHARACTER = (
-        _to_error_code(1100),
-        "INVALID_CHARACTER",
-        "invalid characters found",
-    )
-    INVALID_LENGTH = (
-        _to_error_code(1101),
-        "INVALID_LENGTH",
-        "found an invalid string length",
-    )
-    FOUND_ABS_PATH = (
-        _to_error_code(1200),
-        "FOUND_ABS_PATH",
-        "found an absolute path where must be a relative path",
-    )
-    MALFORMED_ABS_PATH = (
-        _to_error_code(1201),
-        "MALFORMED_ABS_PATH",
-        "found a malformed absolute path",
-    )
-    INVALID_AFTER_SANITIZE = (
-        _to_error_code(2000),
-        "INVALID_AFTER_SANITIZE",
-        "found invalid value after sanitizing",
-    )
-
-    @property
-    def code(self) -> str:
-        """str: Error code."""
-        return self.__code
-
-    @property
-    def name(self) -> str:
-        """str: Error reason name."""
-        return self.__name
-
-    @property
-    def description(self) -> str:
-        """str: Error reason description."""
-        return self.__description
-
-    def __init__(self, code: str, name: str, description: str) -> None:
-        self.__name = name
-        self.__code = code
-        self.__description = description
+    NULL_NAME = 1001
+    RESERVED_NAME = 1002
+    INVALID_CHARACTER = 1100
+    INVALID_LENGTH = 1101
+    FOUND_ABS_PATH = 1200
+    MALFORMED_ABS_PATH = 1201
+    INVALID_AFTER_SANITIZE = 2000
+
+    def __init__(self, value: int) -> None:
+        code, description = _ERROR_META[value]
+        #: str: Error code.
+        self.code = sys.intern(code)
+        #: str: Error reason description.
+        self.description = sys.intern(description)
 
     def __str__(self) -> str:
-        return f"[{self.__code}] {self.__description}"
+        return f"[{self.code}] {self.description}"
+
+    def __format__(self, format_spec: str) -> str:
+        # IntEnum formats with int.__format__ on some Python versions (e.g. 3.7)
+        return format(str(self), format_spec)
 
 
 class ValidationError(ValueError):
@@ -89,61 +65,40 @@ class ValidationError(ValueError):
     Exception class of validation errors.
     """
 
-    @property
-    def platform(self) -> Optional[Platform]:
-        """
-        :py:class:`~pathvalidate.Platform`: Platform information.
-        """
-        return self.__platform
-
-    @property
-    def reason(self) -> ErrorReason:
-        """
-        :py:class:`~pathvalidate.error.ErrorReason`: The cause of the error.
-        """
-        return self.__reason
-
-    @property
-    def description(self) -> Optional[str]:
-        """Optional[str]: Error description."""
-        return self.__description
-
-    @property
-    def reserved_name(self) -> str:
-        """str: Reserved name."""
-        return self.__reserved_name
-
-    @property
-    def reusable_name(self) -> Optional[bool]:
-        """Optional[bool]: Whether the name is reusable or not."""
-        return self.__reusable_name
-
-    @property
-    def fs_encoding(self) -> Optional[str]:
-        """Optional[str]: File system encoding."""
-        return self.__fs_encoding
-
-    @property
-    def byte_count(self) -> Optional[int]:
-        """Optional[int]: Byte count of the path."""
-        return self.__byte_count
-
-    def __init__(self, *args, **kwargs) -> None:  # type: ignore
-        if ErrorAttrKey.REASON not in kwargs:
+    def __init__(
+        self,
+        *args: object,
+        reason: Optional[ErrorReason] = None,
+        byte_count: Optional[int] = None,
+        platform: Optional[Platform] = None,
+        description: Optional[str] = None,
+        reserved_name: str = "",
+        reusable_name: Optional[bool] = None,
+        fs_encoding: Optional[str] = None,
+    ) -> None:
+        if reason is None:
             raise ValueError(f"{ErrorAttrKey.REASON} must be specified")
 
-        self.__reason: ErrorReason = kwargs.pop(ErrorAttrKey.REASON)
-        self.__byte_count: Optional[int] = kwargs.pop(ErrorAttrKey.BYTE_COUNT, None)
-        self.__platform: Optional[Platform] = kwargs.pop(ErrorAttrKey.PLATFORM, None)
-        self.__description: Optional[str] = kwargs.pop(ErrorAttrKey.DESCRIPTION, None)
-        self.__reserved_name: str = kwargs.pop(ErrorAttrKey.RESERVED_NAME, "")
-        self.__reusable_name: Optional[bool] = kwargs.pop(ErrorAttrKey.REUSABLE_NAME, None)
-        self.__fs_encoding: Optional[str] = kwargs.pop(ErrorAttrKey.FS_ENCODING, None)
-
-        try:
-            super().__init__(*args[0], **kwargs)
-        except IndexError:
-            super().__init__(*args, **kwargs)
+        #: :py:class:`~pathvalidate.error.ErrorReason`: The cause of the error.
+        self.reason: ErrorReason = reason
+        #: Optional[int]: Byte count of the path.
+        self.byte_count: Optional[int] = byte_count
+        #: Optional[:py:class:`~pathvalidate.Platform`]: Platform information.
+        self.platform: Optional[Platform] = platform
+        #: Optional[str]: Error description.
+        self.description: Optional[str] = description
+        #: str: Reserved name.
+        self.reserved_name: str = reserved_name
+        #: Optional[bool]: Whether the name is reusable or not.
+        self.reusable_name: Optional[bool] = reusable_name
+        #: Optional[str]: File system encoding.
+        self.fs_encoding: Optional[str] = fs_encoding
+
+        if len(args) == 1 and isinstance(args[0], (list, tuple)):
+            # backward compatibility: accept messages passed as a single list/tuple
+            args = tuple(args[0])
+
+        super().__init__(*args)
 
     def as_slog(self) -> Dict[str, str]:
         """Return a dictionary representation of the error.
@@ -160,32 +115,47 @@ class ValidationError(ValueError):
             slog[ErrorAttrKey.PLATFORM] = self.platform.value
         if self.description:
             slog[ErrorAttrKey.DESCRIPTION] = self.description
-        if self.__reusable_name is not None:
-            slog[ErrorAttrKey.REUSABLE_NAME] = str(self.__reusable_name)
-        if self.__fs_encoding:
-            slog[ErrorAttrKey.FS_ENCODING] = self.__fs_encoding
-        if self.__byte_count:
-            slog[ErrorAttrKey.BYTE_COUNT] = str(self.__byte_count)
+        if self.reusable_name is not None:
+            slog[ErrorAttrKey.REUSABLE_NAME] = str(self.reusable_name)
+        if self.fs_encoding:
+            slog[ErrorAttrKey.FS_ENCODING] = self.fs_encoding
+        if self.byte_count:
+            slog[ErrorAttrKey.BYTE_COUNT] = str(self.byte_count)
 
         return slog
 
     def __str__(self) -> str:
-        item_list = []
         header = str(self.reason)
+        msg = Exception.__str__(self)
+
+        if (
+            not self.platform
+            and not self.description
+            and self.reusable_name is None
+            and not self.fs_encoding
+            and self.byte_count is None
+        ):
+            # fast path: no optional fields to append to the message
+            if not msg:
+                return header
+
+            return f"{header}: {msg.strip()}"
+
+        item_list = []
 
-        if Exception.__str__(self):
-            item_list.append(Exception.__str__(self))
+        if msg:
+            item_list.append(msg)
 
         if self.platform:
             item_list.append(f"{ErrorAttrKey.PLATFORM}={self.platform.value}")
         if self.description:
             item_list.append(f"{ErrorAttrKey.DESCRIPTION}={self.description}")
-        if self.__reusable_name is not None:
+        if self.reusable_name is not None:
             item_list.append(f"{ErrorAttrKey.REUSABLE_NAME}={self.reusable_name}")
-        if self.__fs_encoding:
-            item_list.append(f"{ErrorAttrKey.FS_ENCODING}={self.__fs_encoding}")
-        if self.__byte_count is not None:
-            item_list.append(f"{ErrorAttrKey.BYTE_COUNT}={self.__byte_count:,d}")
+        if self.fs_encoding:
+            item_list.append(f"{ErrorAttrKey.FS_ENCODING}={self.fs_encoding}")
+        if self.byte_count is not None:
+            item_list.append(f"{ErrorAttrKey.BYTE_COUNT}={self.byte_count:,d}")
 
         if item_list:
             header += ": "
@@ -204,7 +174,7 @@ class NullNameError(ValidationError):
     def __init__(self, *args, **kwargs) -> None:  # type: ignore
         kwargs[ErrorAttrKey.REASON] = ErrorReason.NULL_NAME
 
-        super().__init__(args, **kwargs)
+        super().__init__(*args, **kwargs)
 
 
 class InvalidCharError(ValidationError):
@@ -215,7 +185,7 @@ class InvalidCharError(ValidationError):
     def __init__(self, *args, **kwargs) -> None:  # type: ignore[no-untyped-def]
         kwargs[ErrorAttrKey.REASON] = ErrorReason.INVALID_CHARACTER
 
-        super().__init__(args, **kwargs)
+        super().__init__(*args, **kwargs)
 
 
 class ReservedNameError(ValidationError):
@@ -226,7 +196,7 @@ class ReservedNameError(ValidationError):
     def __init__(self, *args, **kwargs) -> None:  # type: ignore[no-untyped-def]
         kwargs[ErrorAttrKey.REASON] = ErrorReason.RESERVED_NAME
 
-        super().__init__(args, **kwargs)
+        super().__init__(*args, **kwargs)
 
 
 class ValidReservedNameError(ReservedNameError):
@@ -238,7 +208,7 @@ class ValidReservedNameError(ReservedNameError):
     def __init__(self, *args, **kwargs) -> None:  # type: ignore[no-untyped-def]
         kwargs[ErrorAttrKey.REUSABLE_NAME] = True
 
-        super().__init__(args, **kwargs)
+        super().__init__(*args, **kwargs)
 
 
 class InvalidReservedNameError(ReservedNameError):
@@ -250,4 +220,4 @@ class InvalidReservedNameError(ReservedNameError):
     def __init__(self, *args, **kwargs) -> None:  # type: ignore[no-untyped-def]
         kwargs[ErrorAttrKey.REUSABLE_NAME] = False
 
-        super().__init__(args, **kwargs)
+        super().__init__(*args, **kwargs)
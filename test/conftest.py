@@ -0,0 +1,26 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import platform as m_platform
+
+import pytest
+
+from pathvalidate._common import _detect_platform
+
+
+@pytest.fixture
+def patch_platform_system(monkeypatch):
+    """Replace platform.system() with the given function.
+
+    The platform detected for ``platform="auto"`` is cached, so the cache is cleared
+    before and after each test.
+    """
+
+    def patch(system):
+        monkeypatch.setattr(m_platform, "system", system)
+        _detect_platform.cache_clear()
+
+    _detect_platform.cache_clear()
+    yield patch
+    _detect_platform.cache_clear()
@@ -0,0 +1,54 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import itertools
+import string
+
+import pytest
+
+from pathvalidate._const import _WIN_RESERVED_FILE_NAMES, is_win_device_name
+
+
+class Test_is_win_device_name:
+    NAME_CHARS = string.ascii_uppercase + string.digits + "$"
+
+    @pytest.mark.parametrize(["value"], [[name] for name in _WIN_RESERVED_FILE_NAMES])
+    def test_normal_reserved(self, value):
+        assert is_win_device_name(value)
+
+    @pytest.mark.parametrize(
+        ["value"],
+        [
+            [""],
+            ["CO"],
+            ["COM"],
+            ["COM0"],
+            ["LPT0"],
+            ["COM10"],
+            ["LPT10"],
+            ["CLOCK"],
+            ["CLOCK$$"],
+            ["CON.TXT"],
+            ["NUL_"],
+            ["con"],
+            ["COM¹"],
+        ],
+    )
+    def test_normal_not_reserved(self, value):
+        assert not is_win_device_name(value)
+
+    @pytest.mark.parametrize(["length"], [[1], [2], [3], [4]])
+    def test_normal_sync_with_reserved_names(self, length):
+        # every name up to four characters agrees with _WIN_RESERVED_FILE_NAMES
+        reserved_names = set(_WIN_RESERVED_FILE_NAMES)
+        for chars in itertools.product(self.NAME_CHARS, repeat=length):
+            name = "".join(chars)
+            assert is_win_device_name(name) == (name in reserved_names), name
+
+    @pytest.mark.parametrize(
+        ["value"],
+        [[prefix + c] for prefix in ("COM", "LPT", "CLOCK") for c in string.printable],
+    )
+    def test_normal_sync_near_misses(self, value):
+        assert is_win_device_name(value) == (value in _WIN_RESERVED_FILE_NAMES)
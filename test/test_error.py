@@ -1,18 +1,30 @@
+import copy
+import pickle
+
 import pytest
 
 from pathvalidate import Platform
-from pathvalidate.error import ErrorReason, ValidationError, _to_error_code
+from pathvalidate.error import ErrorReason, InvalidCharError, ValidationError
 
 
-class Test_to_error_code:
+class Test_ErrorReason:
     @pytest.mark.parametrize(
         ["value", "expected"],
         [
-            [1, "PV0001"],
+            [ErrorReason.NULL_NAME, "[PV1001] the value must not be an empty string"],
+            [ErrorReason.INVALID_CHARACTER, "[PV1100] invalid characters found"],
         ],
     )
-    def test_normal(self, value, expected):
-        assert _to_error_code(value) == expected
+    def test_normal_format(self, value, expected):
+        assert str(value) == expected
+        assert f"{value}" == expected
+        assert "{}".format(value) == expected
+
+    def test_normal_value(self):
+        assert ErrorReason.NULL_NAME.value == 1001
+        assert ErrorReason(1001) is ErrorReason.NULL_NAME
+        assert ErrorReason.NULL_NAME.code == "PV1001"
+        assert ErrorReason.NULL_NAME.name == "NULL_NAME"
 
 
 class Test_str:
@@ -27,6 +39,18 @@ class Test_str:
                 ),
                 "[PV1100] invalid characters found: platform=universal, description=hoge",
             ],
+            [
+                ValidationError("hoge", reason=ErrorReason.INVALID_CHARACTER),
+                "[PV1100] invalid characters found: hoge",
+            ],
+            [
+                ValidationError(reason=ErrorReason.NULL_NAME),
+                "[PV1001] the value must not be an empty string",
+            ],
+            [
+                ValidationError(["too long"], reason=ErrorReason.INVALID_LENGTH),
+                "[PV1101] found an invalid string length: too long",
+            ],
         ],
     )
     def test_normal(self, value, expected):
@@ -49,3 +73,22 @@ class Test_as_slog:
     )
     def test_normal(self, value, expected):
         assert value.as_slog() == expected
+
+
+class Test_copy:
+    @pytest.mark.parametrize(
+        ["copy_func"],
+        [
+            [lambda e: pickle.loads(pickle.dumps(e))],
+            [copy.copy],
+            [copy.deepcopy],
+        ],
+    )
+    def test_normal(self, copy_func):
+        value = InvalidCharError("bad", platform=Platform.WINDOWS, description="d")
+        result = copy_func(value)
+
+        assert result.reason == ErrorReason.INVALID_CHARACTER
+        assert result.platform == Platform.WINDOWS
+        assert result.description == "d"
+        assert str(result) == str(value)
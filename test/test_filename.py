@@ -4,11 +4,10 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
-import platform as m_platform
 import random
 import sys
 from collections import OrderedDict
-from itertools import chain, product
+from itertools import product
 from pathlib import Path, PurePosixPath, PureWindowsPath
 
 import pytest
@@ -60,7 +59,7 @@ class Test_FileSanitizer:
             ["macos", Platform.MACOS],
         ],
     )
-    def test_normal_platform_auto(self, monkeypatch, test_platform, expected):
+    def test_normal_platform_auto(self, patch_platform_system, test_platform, expected):
         if test_platform == "windows":
             patch = platform_windows
         elif test_platform == "linux":
@@ -70,8 +69,7 @@ class Test_FileSanitizer:
         else:
             raise ValueError(f"unexpected test platform: {test_platform}")
 
-        monkeypatch.setattr(m_platform, "system", patch)
-
+        patch_platform_system(patch)
         assert FileNameSanitizer(255, platform="auto").platform == expected
 
     def test_normal_additional_reserved_names(self):
@@ -128,6 +126,16 @@ class Test_FileNameValidator:
             sanitizer.reserved_keywords == FileNameValidator(platform="windows").reserved_keywords
         )
 
+    def test_normal_subclass_reserved_names(self):
+        class CustomValidator(FileNameValidator):
+            _WINDOWS_RESERVED_FILE_NAMES = ("CON", "FOO")
+
+        validator = CustomValidator(platform="windows")
+        assert validator.reserved_keywords == ("CON", "FOO")
+        assert not validator.is_valid("foo")
+        assert not validator.is_valid("con")
+        assert validator.is_valid("nul")
+
 
 class Test_validate_filename:
     VALID_CHARS = VALID_FILENAME_CHARS
@@ -135,20 +143,10 @@ class Test_validate_filename:
 
     @pytest.mark.parametrize(
         ["value", "platform"],
-        chain.from_iterable(
-            [
-                [
-                    args
-                    for args in product(
-                        ["{0}{1}{0}".format(randstr(64), valid_c)], VALID_PLATFORM_NAMES
-                    )
-                ]
-                for valid_c in VALID_CHARS
-            ]
-            + [
-                [args for args in product([filename], VALID_PLATFORM_NAMES)]
-                for filename in NTFS_RESERVED_FILE_NAMES
-            ]
+        product(
+            ["{0}{1}{0}".format(randstr(64), valid_c) for valid_c in VALID_CHARS]
+            + list(NTFS_RESERVED_FILE_NAMES),
+            VALID_PLATFORM_NAMES,
         ),
     )
     def test_normal(self, value, platform):
@@ -184,12 +182,7 @@ class Test_validate_filename:
 
     @pytest.mark.parametrize(
         ["value", "platform"],
-        chain.from_iterable(
-            [
-                [args for args in product([multibyte_name], VALID_PLATFORM_NAMES)]
-                for multibyte_name in VALID_MULTIBYTE_NAMES
-            ]
-        ),
+        product(VALID_MULTIBYTE_NAMES, VALID_PLATFORM_NAMES),
     )
     def test_normal_multibyte(self, value, platform):
         validate_filename(value, platform)
@@ -244,6 +237,9 @@ class Test_validate_filename:
             ["あ" * 86, "universal", "utf-8", 255, ErrorReason.INVALID_LENGTH],
             ["あ" * 126, "universal", "utf-16", 255, None],
             ["あ" * 127, "universal", "utf-16", 255, ErrorReason.INVALID_LENGTH],
+            ["a" * 126, "universal", "utf-16", 255, None],
+            ["a" * 127, "universal", "utf-16", 255, ErrorReason.INVALID_LENGTH],
+            ["a" * 200, "universal", "utf-16", 255, ErrorReason.INVALID_LENGTH],
         ],
     )
     def test_max_len_fs_encoding(self, value, platform, fs_encoding, max_len, expected):
@@ -297,16 +293,9 @@ class Test_validate_filename:
 
     @pytest.mark.parametrize(
         ["value", "platform"],
-        chain.from_iterable(
-            [
-                [
-                    args
-                    for args in product(
-                        ["{0}{1}{0}".format(randstr(64), invalid_c)], VALID_PLATFORM_NAMES
-                    )
-                ]
-                for invalid_c in INVALID_FILENAME_CHARS
-            ]
+        product(
+            ["{0}{1}{0}".format(randstr(64), invalid_c) for invalid_c in INVALID_FILENAME_CHARS],
+            VALID_PLATFORM_NAMES,
         ),
     )
     def test_exception_invalid_char(self, value, platform):
@@ -547,6 +536,19 @@ class Test_sanitize_filename:
         validate_filename(sanitized_name, platform=platform)
         assert is_valid_filename(sanitized_name, platform=platform)
 
+    @pytest.mark.parametrize(
+        ["platform", "value", "replace_text", "expected"],
+        [
+            ["windows", "a?b", "\\n", "a\\nb"],
+            ["windows", "a?b", "\\g<0>", "a\\g<0>b"],
+            ["linux", "a/b", "\\", "a\\b"],
+        ],
+    )
+    def test_normal_replacement_text_literal(self, platform, value, replace_text, expected):
+        # replacement_text is not interpreted as a regular expression template
+        sanitized_name = sanitize_filename(value, platform=platform, replacement_text=replace_text)
+        assert sanitized_name == expected
+
     @pytest.mark.parametrize(
         ["value", "replace_text", "expected"],
         [
@@ -767,6 +769,9 @@ class Test_sanitize_filename:
             ["あ" * 86, "universal", "utf-8", 255, "あ" * 85],
             ["あ" * 126, "universal", "utf-16", 255, "あ" * 126],
             ["あ" * 127, "universal", "utf-16", 255, "あ" * 126],
+            ["a" * 126, "universal", "utf-16", 255, "a" * 126],
+            ["a" * 127, "universal", "utf-16", 255, "a" * 126],
+            ["a" * 200, "universal", "utf-16", 255, "a" * 126],
         ],
     )
     def test_max_len_fs_encoding(self, value, platform, fs_encoding, max_len, expected):
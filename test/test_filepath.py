@@ -8,7 +8,7 @@ import platform as m_platform
 import random
 import sys
 from collections import OrderedDict
-from itertools import chain, product
+from itertools import product
 from pathlib import Path
 
 import pytest
@@ -43,6 +43,10 @@ from ._common import (
 nan = float("nan")
 inf = float("inf")
 
+WIN_RESERVED_FILE_NAMES_EXCEPT_DOTS = tuple(
+    name for name in WIN_RESERVED_FILE_NAMES if name not in (".", "..")
+)
+
 random.seed(0)
 
 
@@ -55,7 +59,7 @@ class Test_FileSanitizer:
             ["macos", Platform.MACOS],
         ],
     )
-    def test_normal_platform_auto(self, monkeypatch, test_platform, expected):
+    def test_normal_platform_auto(self, patch_platform_system, test_platform, expected):
         if test_platform == "windows":
             patch = platform_windows
         elif test_platform == "linux":
@@ -65,8 +69,7 @@ class Test_FileSanitizer:
         else:
             raise ValueError(f"unexpected test platform: {test_platform}")
 
-        monkeypatch.setattr(m_platform, "system", patch)
-
+        patch_platform_system(patch)
         assert FilePathSanitizer(255, platform="auto").platform == expected
 
     def test_normal_additional_reserved_names(self):
@@ -108,21 +111,13 @@ class Test_validate_filepath:
         "\\Users",
     ]
 
-    @pytest.mark.parametrize(
-        ["value", "platform"],
-        chain.from_iterable(
-            [
-                [
-                    args
-                    for args in product(
-                        ["/{0}/{1}{0}".format(randstr(64), valid_c)], ["linux", "macos"]
-                    )
-                ]
-                for valid_c in VALID_CHARS
-            ]
-        ),
-    )
-    def test_normal(self, value, platform):
+    @pytest.fixture(params=VALID_CHARS)
+    def valid_c(self, request):
+        return request.param
+
+    @pytest.mark.parametrize(["platform"], [["linux"], ["macos"]])
+    def test_normal(self, valid_c, platform):
+        value = "/{0}/{1}{0}".format(randstr(64), valid_c)
         validate_filepath(value, platform)
         assert is_valid_filepath(value, platform=platform)
 
@@ -155,12 +150,7 @@ class Test_validate_filepath:
 
     @pytest.mark.parametrize(
         ["value", "platform"],
-        chain.from_iterable(
-            [
-                [args for args in product([valid_path], ["windows"])]
-                for valid_path in VALID_MULTIBYTE_PATHS
-            ]
-        ),
+        product(VALID_MULTIBYTE_PATHS, ["windows"]),
     )
     def test_normal_multibyte(self, value, platform):
         validate_filepath(value, platform)
@@ -238,6 +228,9 @@ class Test_validate_filepath:
             ["/tmp/" + "あ" * 84, "linux", "utf-8", 255, ErrorReason.INVALID_LENGTH],
             ["/tmp/" + "あ" * 121, "linux", "utf-16", 255, None],
             ["/tmp/" + "あ" * 122, "linux", "utf-16", 255, ErrorReason.INVALID_LENGTH],
+            ["/tmp/" + "a" * 121, "linux", "utf-16", 255, None],
+            ["/tmp/" + "a" * 122, "linux", "utf-16", 255, ErrorReason.INVALID_LENGTH],
+            ["a" * 200, "linux", "utf-16", 255, ErrorReason.INVALID_LENGTH],
         ],
     )
     def test_max_len_fs_encoding(self, value, platform, fs_encoding, max_len, expected):
@@ -429,8 +422,9 @@ class Test_validate_filepath:
         ["value", "platform"],
         [
             [f"/foo/abc/{reserved_keyword}.txt", platform]
-            for reserved_keyword, platform in product(WIN_RESERVED_FILE_NAMES, ["linux", "macos"])
-            if reserved_keyword not in [".", ".."]
+            for reserved_keyword, platform in product(
+                WIN_RESERVED_FILE_NAMES_EXCEPT_DOTS, ["linux", "macos"]
+            )
         ]
         + [
             [f"{drive}\\{filename}_", platform]
@@ -454,21 +448,20 @@ class Test_validate_filepath:
         [
             [f"abc\\{reserved_keyword}\\xyz", platform, ValidationError]
             for reserved_keyword, platform in product(
-                WIN_RESERVED_FILE_NAMES, ["windows", "universal"]
+                WIN_RESERVED_FILE_NAMES_EXCEPT_DOTS, ["windows", "universal"]
             )
-            if reserved_keyword not in [".", ".."]
         ]
         + [
             [f"foo/abc/{reserved_keyword}.txt", platform, ValidationError]
-            for reserved_keyword, platform in product(WIN_RESERVED_FILE_NAMES, ["universal"])
-            if reserved_keyword not in [".", ".."]
+            for reserved_keyword, platform in product(
+                WIN_RESERVED_FILE_NAMES_EXCEPT_DOTS, ["universal"]
+            )
         ]
         + [
             [f"{reserved_keyword}", platform, ValidationError]
             for reserved_keyword, platform in product(
-                WIN_RESERVED_FILE_NAMES, ["windows", "universal"]
+                WIN_RESERVED_FILE_NAMES_EXCEPT_DOTS, ["windows", "universal"]
             )
-            if reserved_keyword not in [".", ".."]
         ]
         + [
             [f"{drive}\\{filename}", platform, ValidationError]
@@ -632,6 +625,19 @@ class Test_sanitize_filepath:
         validate_filepath(sanitized_name, platform=platform)
         assert is_valid_filepath(sanitized_name, platform=platform)
 
+    @pytest.mark.parametrize(
+        ["platform", "value", "replace_text", "expected"],
+        [
+            ["linux", "a/b\0c", "\\n", "a/b/nc"],
+            ["linux", "a/b\0c", "\\g<0>", "a/b/g<0>c"],
+            ["linux", "a/b\0c", "\\", "a/b/c"],
+        ],
+    )
+    def test_normal_replacement_text_literal(self, platform, value, replace_text, expected):
+        # replacement_text is not interpreted as a regular expression template
+        sanitized_name = sanitize_filepath(value, platform=platform, replacement_text=replace_text)
+        assert sanitized_name == expected
+
     @pytest.mark.parametrize(
         ["value", "test_platform", "expected"],
         [
@@ -740,21 +746,21 @@ class Test_sanitize_filepath:
     @pytest.mark.parametrize(
         ["value", "replace_text", "expected"],
         [
-            [Path("AA" + c + "B"), rep, Path("AA" + rep + "B")]
+            ["AA" + c + "B", rep, "AA" + rep + "B"]
             for c, rep in product(SANITIZE_CHARS, REPLACE_TEXTS)
         ]
         + [
-            [Path("A" + c + "B"), rep, Path("A" + c + "B")]
+            ["A" + c + "B", rep, "A" + c + "B"]
             for c, rep in product(NOT_SANITIZE_CHARS, REPLACE_TEXTS)
         ]
         + [
-            [Path("あ" + c + "い"), rep, Path("あ" + c + "い")]
+            ["あ" + c + "い", rep, "あ" + c + "い"]
             for c, rep in product(NOT_SANITIZE_CHARS, REPLACE_TEXTS)
         ],
     )
     def test_normal_pathlike(self, value, replace_text, expected):
-        sanitized_name = sanitize_filepath(value, replace_text)
-        assert sanitized_name == expected
+        sanitized_name = sanitize_filepath(Path(value), replace_text)
+        assert sanitized_name == Path(expected)
         assert isinstance(sanitized_name, Path)
 
         validate_filepath(sanitized_name)